@@ -0,0 +1,203 @@
+import asyncio
+from collections import deque
+from dynamic_array import DynamicArray
+
+
+class ArrayClosedError(RuntimeError):
+    """Raised when appending to a closed AsyncDynamicArray or popping from one that
+    is both closed and empty.
+    """
+
+
+class AsyncDynamicArray:
+    """A first in, first out buffer for handing elements between asyncio tasks that
+    stores its elements in a DynamicArray.
+
+    Consumers await pop() or pop_batch() instead of polling len(), and producers await
+    append() which waits while the buffer is at maxsize to apply backpressure. Once
+    close() is called no more elements can be appended, but consumers can keep popping
+    until the buffer is drained, after which ArrayClosedError is raised.
+
+    Popped elements are not shifted out of the DynamicArray one at a time. Instead the
+    front of the buffer is tracked as an offset into it, and the remaining elements are
+    shifted forward once at least half of the DynamicArray has been popped, so popping
+    takes amortized O(1) time per element.
+    """
+
+    def __init__(self, maxsize=0, growth_factor=2):
+        """Initializes an empty buffer which holds at most maxsize elements, or an
+        unbounded number of elements if maxsize is 0 or less.
+        """
+        self._arr = DynamicArray(growth_factor)  # Storage for buffered elements
+        self._head = 0  # Index in self._arr of the element at the front of the buffer
+        self._maxsize = maxsize  # Capacity before append() waits
+        self._closed = False  # Whether producers are finished
+        self._getters = deque()  # Futures of consumers waiting for any element
+        self._putters = deque()  # Futures of producers waiting for room
+        self._lingerers = deque()  # (target length, future) of batches waiting to fill
+
+    def __len__(self):
+        """Return the number of elements waiting in the buffer"""
+        return len(self._arr) - self._head
+
+    def __repr__(self):
+        """Return a string representation of the buffer for testing"""
+        return (f'AsyncDynamicArray({self._arr[self._head:]}, maxsize={self._maxsize}, '
+                f'closed={self._closed})')
+
+    @property
+    def maxsize(self):
+        """Maximum number of buffered elements, 0 or less meaning unbounded"""
+        return self._maxsize
+
+    @property
+    def closed(self):
+        """Whether close() has been called"""
+        return self._closed
+
+    def full(self):
+        """Return True if append() would currently have to wait"""
+        return 0 < self._maxsize <= len(self)
+
+    def empty(self):
+        """Return True if pop() would currently have to wait"""
+        return len(self) == 0
+
+    async def append(self, element):
+        """Add element to the end of the buffer, waiting while the buffer is full"""
+        while not self._closed and self.full():
+            await self._wait(self._putters)
+        if self._closed:
+            raise ArrayClosedError('append to closed array')
+        self._arr.append(element)
+        self._wake_one(self._getters)
+        self._wake_lingerers()
+
+    async def extend(self, seq):
+        """Add all elements from seq to the end of the buffer one at a time"""
+        for element in seq:
+            await self.append(element)
+
+    async def pop(self):
+        """Remove the element at the front of the buffer and return it, waiting until
+        one is available
+        """
+        while not self._closed and self.empty():
+            await self._wait(self._getters)
+        if self.empty():
+            raise ArrayClosedError('pop from closed empty array')
+
+        element = self._arr[self._head]
+        self._arr[self._head] = None  # Drop the reference held by the storage
+        self._head += 1
+        self._compact()
+        self._wake_one(self._putters)
+        return element
+
+    async def pop_batch(self, max_n, timeout=None):
+        """Remove up to max_n elements from the front of the buffer and return them as a
+        DynamicArray.
+
+        With no timeout, this waits until at least one element is available and returns
+        immediately. With a timeout in seconds, this waits up to timeout for max_n
+        elements, or maxsize elements if that is smaller, to arrive and then returns
+        whatever is available, which may be empty.
+        """
+        if max_n < 1:
+            raise ValueError(f'max_n must be at least 1, not {max_n}')
+
+        if timeout is None:
+            while not self._closed and self.empty():
+                await self._wait(self._getters)
+        else:  # Linger so that slow producers can fill a larger batch
+            # A full buffer cannot grow, so never wait for more than maxsize elements
+            target = min(max_n, self._maxsize) if self._maxsize > 0 else max_n
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while not self._closed and len(self) < target:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._wait(self._lingerers, target), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+        if self.empty() and self._closed:
+            raise ArrayClosedError('pop from closed empty array')
+
+        size = min(max_n, len(self))
+        batch = self._arr[self._head:self._head + size]
+        for i in range(self._head, self._head + size):
+            self._arr[i] = None  # Drop the references held by the storage
+        self._head += size
+        self._compact()
+        for _ in range(size):  # Room was made for size more elements
+            self._wake_one(self._putters)
+        return batch
+
+    def close(self):
+        """Stop accepting new elements and wake every waiting producer and consumer"""
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                self._wake_one(waiters)
+        self._wake_lingerers()
+
+    def __aiter__(self):
+        """Iterate asynchronously over popped elements until closed and drained"""
+        return self
+
+    async def __anext__(self):
+        """Return the next popped element or stop once closed and drained"""
+        try:
+            return await self.pop()
+        except ArrayClosedError:
+            raise StopAsyncIteration
+
+    def _compact(self):
+        """Shift the remaining elements to the front of the storage once at least half
+        of it has been popped, so each shift is paid for by the pops before it
+        """
+        if self._head * 2 >= len(self._arr):
+            self._arr._delete_range(0, self._head)
+            self._head = 0
+
+    async def _wait(self, waiters, target=None):
+        """Wait until woken by _wake_one, or by _wake_lingerers once the buffer holds
+        target elements, after which the caller rechecks its condition
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        entry = waiter if target is None else (target, waiter)
+        waiters.append(entry)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            try:  # Cancelled or timed out before being woken
+                waiters.remove(entry)
+            except ValueError:  # Already removed when it was woken
+                pass
+            # A wakeup that arrived just before cancelling is passed on so it is not lost
+            if target is None and waiter.done() and not waiter.cancelled():
+                self._wake_one(waiters)
+            raise
+
+    @staticmethod
+    def _wake_one(waiters):
+        """Wake the task that has waited longest in waiters"""
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    def _wake_lingerers(self):
+        """Wake the batches in pop_batch that have reached their target length or that
+        can no longer grow because the buffer is closed
+        """
+        for entry in list(self._lingerers):
+            target, waiter = entry
+            if self._closed or len(self) >= target:
+                self._lingerers.remove(entry)
+                if not waiter.done():
+                    waiter.set_result(None)
@@ -1,5 +1,11 @@
 import ctypes
+import functools
+import os
 from collections.abc import MutableSequence
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+
+_MISSING = object()  # Sentinel for reduce() when no initial value is passed
 
 
 class DynamicArray(MutableSequence):
@@ -14,7 +20,20 @@ class DynamicArray(MutableSequence):
 
     This class supports adding objects of any type to the array, and there is no need to
     declare an explicit length or type of object stored in the array.
+
+    copy() and snapshot() are O(1) because the new array shares the compact array of the
+    original. Whichever array first writes to the shared compact array copies it before
+    writing, so the other array never sees the change.
+
+    sort(), map(), and reduce() can split the array into chunks that are processed in a
+    pool of worker processes. Arrays shorter than _PARALLEL_THRESHOLD are always
+    processed serially since starting the pool would take longer than the work itself.
+    The threshold only accounts for starting the pool. Every element is also pickled to
+    a worker, and for map() every result is pickled back, which takes about as long as
+    applying a cheap function like abs or operator.add. So map() and reduce() are only
+    faster in parallel when func is expensive.
     """
+    _PARALLEL_THRESHOLD = 100000  # Minimum length before parallel=True uses workers
 
     def __init__(self, growth_factor=2):
         """Initializes DynamicArray with 0 elements, capacity of 1, an empty compact
@@ -22,6 +41,7 @@ class DynamicArray(MutableSequence):
         capacity will double each time that the array becomes full and shrink in half
         when less than 1/4 of the capacity is full.
         """
+        self._ref = _BufferRef()  # Count of arrays sharing self._arr for copy-on-write
         self._length = 0  # Number of elements in array
         self._capacity = 1  # Capacity of array before expanding
         self._arr = self._create_array(self._capacity)  # Compact array of pointers
@@ -30,22 +50,10 @@ class DynamicArray(MutableSequence):
     def __getitem__(self, idx):
         """Return the element at the specified index or return sliced array"""
         if isinstance(idx, slice):
-            # Insert extreme values if none are specified
-            start = 0 if idx.start is None else idx.start
-            stop = self._length if idx.stop is None else idx.stop
-            step = 1 if idx.step is None or idx.step == 0 else idx.step
-
-            # Convert any negative values to positive counterparts
-            if start < 0:
-                start = self._convert_negative_index(start)
-            if stop < 0:
-                stop = self._convert_negative_index(stop)
-            if step < 1:  # Need to flip the start and stop values
-                start, stop = stop - 1, start - 1
-
-            # Return a new array with the values specified by the slice
+            # Return a new array with the values specified by the slice, where
+            # slice.indices places extreme and negative values in bounds like list
             slice_arr = DynamicArray(self._growth_factor)
-            for i in range(start, stop, step):
+            for i in range(*idx.indices(self._length)):
                 slice_arr.append(self._arr[i])
             return slice_arr
 
@@ -57,16 +65,47 @@ class DynamicArray(MutableSequence):
             raise IndexError("Index out of bounds")
 
     def __setitem__(self, idx, element):
-        """Set array value at index to element from syntax arr[idx] = element"""
+        """Set array value at index to element from syntax arr[idx] = element, or replace
+        the sliced values with the values of element from syntax arr[i:j:k] = element
+        """
+        if isinstance(idx, slice):
+            self._set_slice(idx, element)
+            return
+
         if idx < 0:  # For negative indexing, convert to positive counterpart
             idx = self._convert_negative_index(idx)
         if not 0 <= idx < self._length:  # Ignore indices outside of bounds
             raise IndexError(f'index {idx} out of bounds')
+        self._detach()  # Copy shared values before writing
         self._arr[idx] = element
 
     def __delitem__(self, idx):
-        """Delete the item at index from syntax del arr[idx]"""
-        self.pop(idx)
+        """Delete the item at index or the sliced items from syntax del arr[idx]"""
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(self._length)
+            if step == 1:  # Contiguous items can be removed with a single shift
+                self._delete_range(start, stop)
+            else:  # Delete from the back so the remaining indices do not move
+                for i in sorted(range(start, stop, step), reverse=True):
+                    self.pop(i)
+        else:
+            self.pop(idx)
+
+    def __copy__(self):
+        """Return a shallow copy from copy.copy(arr) that is counted as sharing values"""
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        """Return a deep copy from copy.deepcopy(arr) with its own compact array"""
+        deep_arr = DynamicArray(self._growth_factor)
+        memo[id(self)] = deep_arr  # Register first so arrays containing themselves work
+        for i in range(self._length):
+            deep_arr.append(deepcopy(self._arr[i], memo))
+        return deep_arr
+
+    def __del__(self):
+        """Stop counting this array as a user of its compact array"""
+        self._ref.count -= 1
 
     def __len__(self):
         """Return the number of elements in the array"""
@@ -74,7 +113,7 @@ class DynamicArray(MutableSequence):
 
     def __str__(self):
         """Return a string representation of the array"""
-        return f'[{"".join(str(val) + ", " for val in self)[:-2]}]'
+        return f'[{", ".join(repr(val) for val in self)}]'
 
     def __repr__(self):
         """Return a string representation of the array for testing"""
@@ -82,8 +121,8 @@ class DynamicArray(MutableSequence):
 
     def __eq__(self, seq):
         """Check if array is lexicographically equal to seq"""
-        # If seq is different length or not a list, then it is not equal
-        if self._length != len(seq) or not isinstance(seq, list):
+        # If seq is different length or not a list or array, then it is not equal
+        if not isinstance(seq, (list, DynamicArray)) or self._length != len(seq):
             return False
         # seq is equal if every element at the same index has equivalent value
         return all(self._arr[i] == seq[i] for i in range(self._length))
@@ -94,23 +133,31 @@ class DynamicArray(MutableSequence):
 
     def __lt__(self, seq):
         """Check if array is lexicographically less than seq"""
-        if any(self._arr[i] < seq[i] for i in range(min(self._length, len(seq)))):
-            return True
-        return self._length < len(seq)
+        i = self._first_difference(seq)
+        if i < min(self._length, len(seq)):  # First differing elements decide
+            return self._arr[i] < seq[i]
+        return self._length < len(seq)  # Otherwise the shorter sequence is less
 
     def __le__(self, seq):
         """Check if array is lexicographically less than or equal to seq"""
-        if any(self._arr[i] > seq[i] for i in range(min(self._length, len(seq)))):
-            return False
+        i = self._first_difference(seq)
+        if i < min(self._length, len(seq)):
+            return self._arr[i] <= seq[i]
         return self._length <= len(seq)
 
     def __gt__(self, seq):
         """Check if array is lexicographically greater than seq"""
-        return not self.__le__(seq)
+        i = self._first_difference(seq)
+        if i < min(self._length, len(seq)):
+            return self._arr[i] > seq[i]
+        return self._length > len(seq)
 
     def __ge__(self, seq):
         """Check if array is lexicographically greater than or equal to seq"""
-        return not self.__lt__(seq)
+        i = self._first_difference(seq)
+        if i < min(self._length, len(seq)):
+            return self._arr[i] >= seq[i]
+        return self._length >= len(seq)
 
     def __add__(self, right_arr):
         """Concatenate array with the right operand"""
@@ -147,11 +194,14 @@ class DynamicArray(MutableSequence):
         """Add a new element to the end of the array"""
         if self._length == self._capacity:  # Need to increase size
             self._grow_arr()  # Increase capacity by growth factor
+        self._detach()  # Copy shared values before writing
         self._arr[self._length] = element
         self._length += 1
 
     def extend(self, seq):
         """Add all elements from seq to end of array"""
+        if seq is self:  # Iterate over a copy so appended elements are not revisited
+            seq = self.copy()
         for element in seq:
             self.append(element)
 
@@ -161,8 +211,9 @@ class DynamicArray(MutableSequence):
             self._grow_arr()
 
         if idx < 0:  # For negative indexing, convert to positive counterpart
-            idx = self._convert_negative_index(idx)
+            idx = max(0, self._convert_negative_index(idx))  # Any index before 0 is converted
         idx = min(self._length, idx)  # Any index over the length is converted
+        self._detach()  # Copy shared values before writing
 
         # Move values after idx one right to make room for new element
         for i in range(self._length, idx, -1):
@@ -174,6 +225,7 @@ class DynamicArray(MutableSequence):
         """Remove first instance of element from array"""
         for i in range(self._length):  # Find index of element in array
             if self._arr[i] == element:
+                self._detach()  # Copy shared values before writing
                 # Move all elements after index j one forward to "delete" element
                 for j in range(i, self._length - 1):
                     self._arr[j] = self._arr[j + 1]
@@ -190,6 +242,8 @@ class DynamicArray(MutableSequence):
             raise IndexError(f'index {idx} out of bounds')
 
         element = self._arr[idx]  # Save element so it can be returned
+        if idx < self._length - 1:  # Popping from the end only changes the length
+            self._detach()  # Copy shared values before writing
         # Move all elements after index i one forward to "delete" element
         for i in range(idx, self._length - 1):
             self._arr[i] = self._arr[i + 1]
@@ -206,7 +260,9 @@ class DynamicArray(MutableSequence):
         """Return index of first item matching element with support for slicing"""
         if end is None:  # Only bound end if value has been provided
             end = self._length
-        if end < 0:  # For negative indexing, convert to positive counterpart
+        if start < 0:  # For negative indexing, convert to positive counterpart
+            start = self._convert_negative_index(start)
+        if end < 0:
             end = self._convert_negative_index(end)
 
         start = min(self._length, max(0, start))  # Place start in bounds if extreme
@@ -224,51 +280,188 @@ class DynamicArray(MutableSequence):
                 count += 1
         return count
 
-    def sort(self):
-        """Sort elements in ascending order in place"""
-        self._quick_sort(0, self._length - 1)
+    def sort(self, parallel=False, workers=None):
+        """Sort elements in ascending order in place, sorting chunks in worker processes
+        and merging them back into the array when parallel is True
+        """
+        self._detach()  # Copy shared values before writing
+        if self._use_parallel(parallel):
+            # Workers only return the sorted order of each chunk, so the array is filled
+            # with its own elements rather than the copies that were sent to the workers
+            size = self._chunk_size(workers)
+            elements = self._arr[:self._length]
+            for start, positions in zip(range(0, self._length, size),
+                                        self._map_chunks(_sort_chunk, workers)):
+                for i, position in enumerate(positions):
+                    self._arr[start + i] = elements[start + position]
+            self._merge_sort(size)  # Stable merge of the sorted chunks
+        else:
+            self._merge_sort()
+
+    def map(self, func, parallel=False, workers=None):
+        """Return a new array with func applied to every element, applying it to chunks
+        in worker processes when parallel is True. func must be picklable to run in parallel,
+        and running in parallel is only faster when func is expensive.
+        """
+        map_arr = DynamicArray(self._growth_factor)
+        if self._use_parallel(parallel):
+            for mapped_chunk in self._map_chunks(functools.partial(_map_chunk, func), workers):
+                map_arr.extend(mapped_chunk)
+        else:
+            for i in range(self._length):
+                map_arr.append(func(self._arr[i]))
+        return map_arr
+
+    def reduce(self, func, initial=_MISSING, parallel=False, workers=None):
+        """Return the elements combined from left to right with func like functools.reduce,
+        reducing chunks in worker processes and then combining their results when parallel
+        is True. func must be associative and picklable to run in parallel, and running in
+        parallel is only faster when func is expensive.
+        """
+        if self._use_parallel(parallel):
+            values = self._map_chunks(functools.partial(functools.reduce, func), workers)
+        else:
+            values = (self._arr[i] for i in range(self._length))
+
+        if initial is _MISSING:
+            if self._length == 0:
+                raise TypeError('reduce() of empty array with no initial value')
+            return functools.reduce(func, values)
+        return functools.reduce(func, values, initial)
 
     def reverse(self):
         """Reverse all elements of the array in place"""
         left = 0  # Start at beginning of array
         right = self._length - 1  # Start at end of array
+        self._detach()  # Copy shared values before writing
         while left <= right:  # Swap values until pointers collide
             self._arr[left], self._arr[right] = self._arr[right], self._arr[left]
             left, right = left + 1, right - 1
 
     def copy(self):
-        """Return a shallow copy of the array"""
-        copy_arr = DynamicArray(self._growth_factor)  # Create new array to store values
-        for i in range(self._length):  # Append all values from original
-            copy_arr.append(self._arr[i])
+        """Return a shallow copy of the array that shares values until either is modified"""
+        copy_arr = DynamicArray(self._growth_factor)  # Create new array to share values
+        copy_arr._arr = self._arr
+        copy_arr._capacity = self._capacity
+        copy_arr._length = self._length
+        copy_arr._ref = self._ref  # Both arrays now copy before writing
+        self._ref.count += 1
         return copy_arr
 
-    def _quick_sort(self, start, end):
-        """Recursively sort elements using the quick sort algorithm end inclusive"""
-        if start >= end:  # Length of 1 or less
-            return
+    def snapshot(self):
+        """Return a copy that keeps the current values for readers even if the array is
+        later modified, without copying any values unless one of them is modified
+        """
+        return self.copy()
 
-        pivot = self._arr[end]  # Select pivot as last value in array
-        left = start
-        right = end - 1  # Begin one before the pivot
+    def _merge_sort(self, width=1):
+        """Sort elements using a bottom up merge sort, which keeps equal elements in
+        their original order like list.sort and needs no recursion. Every run of width
+        elements must already be sorted.
+        """
+        src = self._arr  # Runs of width elements are sorted in src
+        dst = self._create_array(self._capacity)  # Merged runs of 2 * width elements
+        while width < self._length:
+            for start in range(0, self._length, 2 * width):
+                mid = min(start + width, self._length)
+                end = min(start + 2 * width, self._length)
+                left, right, out = start, mid, start
+
+                while left < mid and right < end:  # Merge the two runs
+                    # Take from the right run only if strictly less to keep sort stable
+                    if src[right] < src[left]:
+                        dst[out] = src[right]
+                        right += 1
+                    else:
+                        dst[out] = src[left]
+                        left += 1
+                    out += 1
+                dst[out:end] = src[left:mid] if left < mid else src[right:end]  # Leftovers
+
+            src, dst = dst, src  # Merged runs become the input of the next pass
+            width *= 2
+        self._arr = src
+
+    def _first_difference(self, seq):
+        """Return the first index where array and seq differ or the shorter length"""
+        for i in range(min(self._length, len(seq))):
+            if not self._arr[i] == seq[i]:
+                return i
+        return min(self._length, len(seq))
 
-        while left <= right:  # Continue until all values are ordered
-            while left <= right and self._arr[left] < pivot:  # Find first value greater than pivot
-                left += 1
-            while left <= right and pivot < self._arr[right]:  # Find first value less than pivot
-                right -= 1
+    def _use_parallel(self, parallel):
+        """Return True if parallel work was requested and the array is long enough"""
+        return parallel and self._length >= max(1, self._PARALLEL_THRESHOLD)
 
-            if left <= right:  # If unordered, then swap two found values
-                self._arr[left], self._arr[right] = self._arr[right], self._arr[left]
-                left, right = left + 1, right - 1  # Increment for next iteration
+    def _chunk_size(self, workers=None):
+        """Return the length of the chunks that _map_chunks splits the array into"""
+        workers = workers or os.cpu_count() or 1
+        return -(-self._length // workers)  # Round up so there are at most workers chunks
 
-        self._arr[left], self._arr[end] = self._arr[end], self._arr[left]  # Move pivot to middle
-        self._quick_sort(start, left - 1)  # Sort left portion
-        self._quick_sort(left + 1, end)  # Sort right portion
+    def _map_chunks(self, func, workers=None):
+        """Split the array into one chunk per worker and return the results of calling
+        func on each chunk in a process pool, in chunk order
+        """
+        workers = workers or os.cpu_count() or 1
+        size = self._chunk_size(workers)
+        chunks = [self._arr[i:min(i + size, self._length)] for i in range(0, self._length, size)]
+        with ProcessPoolExecutor(workers) as executor:
+            return list(executor.map(func, chunks))
+
+    def _delete_range(self, start, stop):
+        """Remove elements from start to stop (exclusive) with a single shift"""
+        start = min(self._length, max(0, start))  # Place start in bounds if extreme
+        stop = min(self._length, max(start, stop))  # Place stop in bounds if extreme
+        removed = stop - start
+        if removed == 0:
+            return
+
+        self._detach()  # Copy shared values before writing
+        # Move all elements after stop into the gap in one pass
+        for i in range(start, self._length - removed):
+            self._arr[i] = self._arr[i + removed]
+        self._length -= removed
+        self._shrink_to_fit()
+
+    def _set_slice(self, idx, seq):
+        """Replace the values selected by slice idx with the values of seq like list"""
+        values = list(seq)  # Also copies seq first if it is this array
+        start, stop, step = idx.indices(self._length)
+
+        if step != 1:  # Extended slices replace values one for one
+            indices = range(start, stop, step)
+            if len(values) != len(indices):
+                raise ValueError(f'attempt to assign sequence of size {len(values)} '
+                                 f'to extended slice of size {len(indices)}')
+            self._detach()  # Copy shared values before writing
+            for i, value in zip(indices, values):
+                self._arr[i] = value
+            return
+
+        # Contiguous slices can change length, so the values after the slice are saved,
+        # and then the new values and the saved values are appended after start
+        stop = max(start, stop)
+        after = self._arr[stop:self._length]
+        self._length = start
+        self.extend(values)
+        self.extend(after)
+        self._shrink_to_fit()
+
+    def _shrink_to_fit(self):
+        """Shrink as many times as needed after removing many elements at once, but
+        only copy the values once
+        """
+        new_capacity = self._capacity
+        while self._length < int(new_capacity / (self._growth_factor ** 2)):
+            new_capacity //= self._growth_factor
+        if new_capacity != self._capacity:
+            self._resize_arr(new_capacity)
 
     def _convert_negative_index(self, idx):
-        """Convert negative index to its positive counterpart"""
-        return max(0, self._length + idx)
+        """Convert negative index to its positive counterpart, which is still negative
+        if idx is before the start of the array
+        """
+        return self._length + idx
 
     def _check_shrink(self):
         """Checks if array should shrink and executes _shrink_arr if True"""
@@ -299,6 +492,14 @@ class DynamicArray(MutableSequence):
         # Set the arr to the new array
         self._arr = longer_arr
         self._capacity = new_capacity
+        if self._ref.count > 1:  # Stop sharing the old array with other arrays
+            self._ref.count -= 1
+            self._ref = _BufferRef()
+
+    def _detach(self):
+        """Copy the compact array if it is shared so it can be written to"""
+        if self._ref.count > 1:
+            self._resize_arr(self._capacity)
 
     @staticmethod
     def _create_array(capacity):
@@ -306,6 +507,25 @@ class DynamicArray(MutableSequence):
         return (ctypes.py_object * capacity)()
 
 
+class _BufferRef:
+    """Number of DynamicArray instances sharing the same compact array"""
+    __slots__ = ('count',)
+
+    def __init__(self):
+        """Initializes the count for the single array that created the compact array"""
+        self.count = 1
+
+
+def _sort_chunk(chunk):
+    """Return the positions of the elements of chunk in stable sorted order"""
+    return sorted(range(len(chunk)), key=chunk.__getitem__)
+
+
+def _map_chunk(func, chunk):
+    """Return a list of func applied to every element of chunk"""
+    return [func(element) for element in chunk]
+
+
 # Support for anything that needs to be done when module is invoked directly
 if __name__ == '__main__':
     pass
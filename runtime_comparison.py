@@ -1,4 +1,6 @@
-import sys
+import operator
+import os
+import random
 from dynamic_array import DynamicArray
 from time import time
 
@@ -8,9 +10,9 @@ SMALL = 10
 MEDIUM = 100
 LARGE = 1000
 
-DEF_VAL = 6  # Default value to pass to methods that need a number (Example: arr.append(6))
+PARALLEL = 200000  # Length of the array for comparing parallel runtimes across worker counts
 
-sys.setrecursionlimit(1500)  # Allow for greater recursion depth for sort test
+DEF_VAL = 6  # Default value to pass to methods that need a number (Example: arr.append(6))
 
 
 def comp_method_runtime(method, times, arr_dyn, arr_list, value=None):
@@ -96,16 +98,57 @@ def comp_public_methods():
     return results
 
 
-result = comp_public_methods()  # Calculate runtimes
+def comp_parallel_scaling(max_workers=None):
+    """Return a dictionary containing the runtimes in milliseconds of the parallel methods
+    for a PARALLEL element array run serially and with 1 to max_workers worker processes
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    values = [random.random() for i in range(PARALLEL)]
+
+    # Define each method as a tuple containing the name and arguments to pass to the method.
+    # The functions passed to map and reduce are builtins so they can be pickled to workers.
+    methods = [('sort', []),
+               ('map', [abs]),
+               ('reduce', [operator.add])]
+
+    results = {}  # Stores the runtimes
+
+    for method_name, args in methods:
+        results[method_name] = []
+        # None runs the method serially, and any number runs it with that many workers
+        for workers in [None] + list(range(1, max_workers + 1)):
+            arr = DynamicArray()
+            arr.extend(values)  # sort() works in place, so every run needs a fresh array
+            kwargs = {} if workers is None else {'parallel': True, 'workers': workers}
+
+            start_time = time()
+            arr.__getattribute__(method_name)(*args, **kwargs)
+            end_time = time()
+            results[method_name].append((end_time - start_time) * 10 ** 3)
+
+    return results
+
 
-# Print results separated by method
-print(f'{"":<30}n = {SMALL:<11}n = {MEDIUM:<11}n = {LARGE:<11}')
-for method, times in result.items():
-    print(f'{method:<10}', end='')
-    for implementation, time in times.items():
-        if implementation == 'dynamic':
-            print(f'{"| DynamicArray":<20}{time[0]:<15.2f}{time[1]:<15.2f}{time[2]:<15.2f}')
-        else:
-            print(f'{"":<10}{"| Native List":<20}{time[0]:<15.2f}{time[1]:<15.2f}{time[2]:<15.2f}')
-    print(f'{"":-<75}')
+if __name__ == '__main__':
+    result = comp_public_methods()  # Calculate runtimes
+
+    # Print results separated by method
+    print(f'{"":<30}n = {SMALL:<11}n = {MEDIUM:<11}n = {LARGE:<11}')
+    for method, times in result.items():
+        print(f'{method:<10}', end='')
+        for implementation, runtime in times.items():
+            if implementation == 'dynamic':
+                print(f'{"| DynamicArray":<20}{runtime[0]:<15.2f}{runtime[1]:<15.2f}{runtime[2]:<15.2f}')
+            else:
+                print(f'{"":<10}{"| Native List":<20}{runtime[0]:<15.2f}{runtime[1]:<15.2f}{runtime[2]:<15.2f}')
+        print(f'{"":-<75}')
+
+    result = comp_parallel_scaling()  # Calculate parallel runtimes
+
+    # Print results separated by method with one column per number of workers
+    print(f'\nParallel runtimes in milliseconds for n = {PARALLEL}')
+    print(f'{"":<10}{"serial":<11}', end='')
+    print(''.join(f'{str(workers) + " workers":<11}' for workers in range(1, len(result['sort']))))
+    for method, times in result.items():
+        print(f'{method:<10}' + ''.join(f'{runtime:<11.2f}' for runtime in times))
 
@@ -0,0 +1,160 @@
+import asyncio
+import unittest
+from async_dynamic_array import AsyncDynamicArray, ArrayClosedError
+
+
+class AsyncDynamicArrayTestCase(unittest.IsolatedAsyncioTestCase):
+    """Tests for the awaitable methods of the AsyncDynamicArray class using _MAXSIZE
+    as the capacity of bounded buffers.
+    """
+    _MAXSIZE = 3
+
+    async def test_pop_in_order(self):
+        """Test that elements are popped in the order they were appended"""
+        buf = AsyncDynamicArray()
+        await buf.extend(range(5))
+        self.assertEqual([i for i in range(5)], [await buf.pop() for _ in range(5)])
+        self.assertTrue(buf.empty())
+
+    async def test_pop_waits_for_append(self):
+        """Test that pop waits for a producer instead of raising on an empty buffer"""
+        buf = AsyncDynamicArray()
+        consumer = asyncio.create_task(buf.pop())
+        await asyncio.sleep(0)
+        self.assertFalse(consumer.done())  # Nothing to pop yet
+
+        await buf.append('apple')
+        self.assertEqual('apple', await consumer)
+
+    async def test_append_backpressure(self):
+        """Test that append waits while the buffer is full until a consumer pops"""
+        buf = AsyncDynamicArray(self._MAXSIZE)
+        await buf.extend(range(self._MAXSIZE))
+        self.assertTrue(buf.full())
+
+        producer = asyncio.create_task(buf.append(self._MAXSIZE))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())  # Blocked by maxsize
+        self.assertEqual(self._MAXSIZE, len(buf))
+
+        self.assertEqual(0, await buf.pop())
+        await producer
+        self.assertEqual(self._MAXSIZE, len(buf))
+
+    async def test_pop_batch_available(self):
+        """Test that pop_batch returns at most max_n elements without waiting for more"""
+        buf = AsyncDynamicArray()
+        await buf.extend(range(5))
+        self.assertEqual([0, 1, 2], await buf.pop_batch(3))
+        self.assertEqual([3, 4], await buf.pop_batch(3))
+
+    async def test_pop_batch_timeout(self):
+        """Test that pop_batch lingers for a full batch and returns what arrived"""
+        buf = AsyncDynamicArray()
+        await buf.append(0)
+        self.assertEqual([0], await buf.pop_batch(3, timeout=0.01))
+        self.assertEqual([], await buf.pop_batch(3, timeout=0.01))  # Nothing arrived
+
+        async def produce():
+            for i in range(3):
+                await asyncio.sleep(0)
+                await buf.append(i)
+
+        producer = asyncio.create_task(produce())
+        self.assertEqual([0, 1, 2], await buf.pop_batch(3, timeout=1))
+        await producer
+
+    async def test_pop_batch_bounded_timeout(self):
+        """Test that pop_batch stops lingering once a bounded buffer is full since
+        backpressure means it cannot grow any further
+        """
+        buf = AsyncDynamicArray(self._MAXSIZE)
+        await buf.extend(range(self._MAXSIZE))
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        self.assertEqual([i for i in range(self._MAXSIZE)], await buf.pop_batch(10, timeout=5))
+        self.assertLess(loop.time() - start_time, 1)
+
+    async def test_drain_large_buffer(self):
+        """Test that draining a large buffer keeps order and compacts the storage"""
+        num_elements = 100000
+        buf = AsyncDynamicArray()
+        await buf.extend(range(num_elements))
+
+        popped = [await buf.pop() for _ in range(num_elements // 2)]
+        while not buf.empty():
+            popped.extend(await buf.pop_batch(1000))
+        self.assertEqual([i for i in range(num_elements)], popped)
+
+        # Protected data is checked to make sure popped elements do not stay in storage
+        self.assertEqual(0, len(buf._arr))
+        self.assertEqual(0, buf._head)
+
+    async def test_pop_batch_invalid(self):
+        """Test that ValueError is raised when max_n is less than 1"""
+        with self.assertRaises(ValueError):
+            await AsyncDynamicArray().pop_batch(0)
+
+    async def test_close_drains(self):
+        """Test that remaining elements can be popped after closing and then it raises"""
+        buf = AsyncDynamicArray()
+        await buf.extend(range(3))
+        buf.close()
+
+        with self.assertRaises(ArrayClosedError):
+            await buf.append(3)
+        self.assertEqual([0, 1, 2], [element async for element in buf])
+        with self.assertRaises(ArrayClosedError):
+            await buf.pop()
+
+    async def test_close_wakes_waiters(self):
+        """Test that close wakes waiting consumers and producers with ArrayClosedError"""
+        buf = AsyncDynamicArray(1)
+        consumer = asyncio.create_task(buf.pop_batch(2))
+        await asyncio.sleep(0)
+        buf.close()
+        with self.assertRaises(ArrayClosedError):
+            await consumer
+
+        buf = AsyncDynamicArray(1)
+        await buf.append(0)
+        producer = asyncio.create_task(buf.append(1))
+        await asyncio.sleep(0)
+        buf.close()
+        with self.assertRaises(ArrayClosedError):
+            await producer
+
+    async def test_append_wakes_one_consumer(self):
+        """Test that each append wakes only one of several waiting consumers"""
+        buf = AsyncDynamicArray()
+        consumers = [asyncio.create_task(buf.pop()) for _ in range(3)]
+        await asyncio.sleep(0)
+        await buf.append('apple')
+        self.assertEqual(2, len(buf._getters))  # The others keep waiting
+
+        await buf.extend(['banana', 'cherry'])
+        self.assertEqual(['apple', 'banana', 'cherry'], await asyncio.gather(*consumers))
+
+    async def test_cancelled_wakeup_passed_on(self):
+        """Test that a consumer cancelled after being woken passes the wakeup on"""
+        buf = AsyncDynamicArray()
+        first = asyncio.create_task(buf.pop())
+        second = asyncio.create_task(buf.pop())
+        await asyncio.sleep(0)
+
+        await buf.append('apple')  # Wakes first, which is cancelled before it runs
+        first.cancel()
+        self.assertEqual('apple', await asyncio.wait_for(second, 1))
+        self.assertTrue(first.cancelled())
+
+    async def test_cancelled_waiter_removed(self):
+        """Test that a cancelled pop does not leave its waiter behind"""
+        buf = AsyncDynamicArray()
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(buf.pop(), 0.01)
+        self.assertEqual(0, len(buf._getters))
+
+
+# Run tests when executed directly
+if __name__ == '__main__':
+    unittest.main()
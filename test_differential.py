@@ -0,0 +1,360 @@
+import functools
+import gc
+import math
+import os
+import random
+import unittest
+from time import perf_counter
+from dynamic_array import DynamicArray
+
+
+@functools.total_ordering
+class _Item:
+    """Element that compares by value only, so tag shows which of several equal items
+    ended up where and sort stability can be checked
+    """
+    def __init__(self, value, tag):
+        self.value = value
+        self.tag = tag
+
+    def __eq__(self, other):
+        return isinstance(other, _Item) and self.value == other.value
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __repr__(self):
+        return f'{self.value}.{self.tag}'
+
+
+class _LessThanOnly:
+    """Element that only defines __lt__, so == falls back to identity like most user
+    classes and two elements can be neither less than each other nor equal
+    """
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return self.value < other.value
+
+    def __repr__(self):
+        return f'{self.value}@{id(self):x}'
+
+
+def _normalize(result):
+    """Return result in a form that can be compared between DynamicArray and list"""
+    if isinstance(result, (DynamicArray, list)):
+        return [_normalize(element) for element in result]
+    if isinstance(result, _Item):
+        return result.value, result.tag
+    return result
+
+
+class DifferentialTestCase(unittest.TestCase):
+    """Randomized differential tests which run the same long sequences of mixed operations
+    on a DynamicArray and a list and check that every result, raised exception type, and
+    resulting value matches. Each trace uses the seed of its index, and failing traces
+    are shrunk to a minimal sequence of operations before being reported.
+    """
+    _TRACES = 100  # Number of random traces to run
+    _TRACE_LENGTH = 150  # Number of operations in each trace
+    _VALUES = 6  # Elements take values in range(_VALUES) so there are many equal elements
+
+    # Each operation is run on both implementations as op(state, *args) where state holds
+    # the array under test in 'arr' and any copies taken from it in 'copies'
+    _OPERATIONS = {
+        'append': lambda s, x: s['arr'].append(x),
+        'extend': lambda s, xs: s['arr'].extend(xs),
+        'extend_self': lambda s: s['arr'].extend(s['arr']),
+        'insert': lambda s, i, x: s['arr'].insert(i, x),
+        'remove': lambda s, x: s['arr'].remove(x),
+        'pop': lambda s: s['arr'].pop(),
+        'pop_index': lambda s, i: s['arr'].pop(i),
+        'pop_many': lambda s, n: [s['arr'].pop() for _ in range(min(n, len(s['arr'])))],
+        'clear': lambda s: s['arr'].clear(),
+        'index': lambda s, x, i, j: s['arr'].index(x, i, j),
+        'count': lambda s, x: s['arr'].count(x),
+        'sort': lambda s: s['arr'].sort(),
+        'reverse': lambda s: s['arr'].reverse(),
+        'getitem': lambda s, i: s['arr'][i],
+        'setitem': lambda s, i, x: s['arr'].__setitem__(i, x),
+        'delitem': lambda s, i: s['arr'].__delitem__(i),
+        'slice': lambda s, i, j, k: s['arr'][i:j:k],
+        'del_slice': lambda s, i, j, k: s['arr'].__delitem__(slice(i, j, k)),
+        'set_slice': lambda s, i, j, k, xs: s['arr'].__setitem__(slice(i, j, k), xs),
+        'set_slice_self': lambda s, i, j: s['arr'].__setitem__(slice(i, j), s['arr']),
+        'contains': lambda s, x: x in s['arr'],
+        'len': lambda s: len(s['arr']),
+        'str': lambda s: str(s['arr']),
+        'eq': lambda s, xs: (s['arr'] == xs, s['arr'] != xs),
+        'lt': lambda s, xs: s['arr'] < xs,
+        'le': lambda s, xs: s['arr'] <= xs,
+        'gt': lambda s, xs: s['arr'] > xs,
+        'ge': lambda s, xs: s['arr'] >= xs,
+        'eq_copy': lambda s: s['arr'] == s['arr'].copy(),
+        'add': lambda s: s['arr'] + s['arr'],
+        'mul': lambda s, n: s['arr'] * n,
+        'copy': lambda s: s['copies'].append(s['arr'].copy()),
+        'snapshot': lambda s: s['copies'].append(
+            s['arr'].snapshot() if isinstance(s['arr'], DynamicArray) else s['arr'].copy()),
+        'copy_append': lambda s, c, x: s['copies'][c % len(s['copies'])].append(x),
+        'copy_setitem': lambda s, c, i, x: s['copies'][c % len(s['copies'])].__setitem__(i, x),
+    }
+
+    def random_operation(self, rng, tags):
+        """Return a random operation as a tuple of its name and arguments"""
+        def item():
+            return _Item(rng.randrange(self._VALUES), next(tags))
+
+        def index():  # Mostly valid, sometimes negative or out of bounds
+            return rng.randint(-12, 12)
+
+        def items():
+            return [item() for _ in range(rng.choice([0, 1, 2, 5, 20]))]
+
+        name = rng.choice(list(self._OPERATIONS))
+        args = {
+            'append': lambda: (item(),),
+            'extend': lambda: (items(),),
+            'insert': lambda: (index(), item()),
+            'remove': lambda: (item(),),
+            'pop_index': lambda: (index(),),
+            'pop_many': lambda: (rng.randint(1, 20),),
+            'index': lambda: (item(), index(), rng.choice([index(), 100])),
+            'count': lambda: (item(),),
+            'getitem': lambda: (index(),),
+            'setitem': lambda: (index(), item()),
+            'delitem': lambda: (index(),),
+            'slice': lambda: (rng.choice([None, index()]), rng.choice([None, index()]),
+                              rng.choice([None, -3, -2, -1, 1, 2, 3])),
+            'del_slice': lambda: (rng.choice([None, index()]), rng.choice([None, index()]),
+                                  rng.choice([None, -2, -1, 1, 2])),
+            'set_slice': lambda: (rng.choice([None, index()]), rng.choice([None, index()]),
+                                  rng.choice([None, None, -2, -1, 1, 2]), items()),
+            'set_slice_self': lambda: (rng.choice([None, index()]), rng.choice([None, index()])),
+            'contains': lambda: (item(),),
+            'eq': lambda: (items(),),
+            'lt': lambda: (items(),),
+            'le': lambda: (items(),),
+            'gt': lambda: (items(),),
+            'ge': lambda: (items(),),
+            'mul': lambda: (rng.randint(-1, 3),),
+            'copy_append': lambda: (rng.randrange(4), item()),
+            'copy_setitem': lambda: (rng.randrange(4), index(), item()),
+        }.get(name, lambda: ())()
+        return name, args
+
+    def random_trace(self, seed):
+        """Return the growth factor and operations of the trace for seed"""
+        rng = random.Random(seed)
+        tags = iter(range(10 ** 9))  # Unique tag for every created element
+        growth_factor = rng.choice([2, 3])
+        return growth_factor, [self.random_operation(rng, tags) for _ in range(self._TRACE_LENGTH)]
+
+    def run_trace(self, growth_factor, trace):
+        """Run trace on a DynamicArray and a list and return a description of the first
+        difference between them, or None if they always matched
+        """
+        states = {'dynamic': {'arr': DynamicArray(growth_factor), 'copies': []},
+                  'native': {'arr': [], 'copies': []}}
+
+        for step, (name, args) in enumerate(trace):
+            outcomes = {}
+            for implementation, state in states.items():
+                if name.startswith('copy_') and not state['copies']:
+                    outcomes[implementation] = None  # Nothing to modify yet
+                    continue
+                try:
+                    outcomes[implementation] = _normalize(self._OPERATIONS[name](state, *args))
+                except Exception as e:  # Only the type of exception needs to match
+                    outcomes[implementation] = type(e)
+
+            dynamic, native = states['dynamic'], states['native']
+            if outcomes['dynamic'] != outcomes['native']:
+                error = f'returned {outcomes["dynamic"]!r}, list returned {outcomes["native"]!r}'
+            elif _normalize(dynamic['arr']) != _normalize(native['arr']):
+                error = f'left {dynamic["arr"]!r}, list left {native["arr"]!r}'
+            elif _normalize(dynamic['copies']) != _normalize(native['copies']):
+                error = f'left copies {dynamic["copies"]!r}, list left {native["copies"]!r}'
+            else:
+                error = self.check_invariants(dynamic['arr'])
+            if error is not None:
+                return f'step {step} {name}{args} {error}'
+        return None
+
+    @staticmethod
+    def check_invariants(arr):
+        """Return a description of any broken invariant of the underlying compact array"""
+        # Protected data is checked to make sure growing and shrinking keep the capacity
+        # proportional to the number of stored elements
+        if arr._capacity != len(arr._arr) or not arr._length <= arr._capacity:
+            return f'has length {arr._length} and capacity {arr._capacity}'
+        if arr._length < int(arr._capacity / (arr._growth_factor ** 2)):
+            return f'did not shrink capacity {arr._capacity} for length {arr._length}'
+        return None
+
+    def shrink_trace(self, growth_factor, trace):
+        """Return the shortest trace found by removing chunks of operations from trace
+        while it still fails
+        """
+        chunk = len(trace) // 2
+        while chunk >= 1:
+            start, removed = 0, False
+            while start < len(trace):
+                candidate = trace[:start] + trace[start + chunk:]
+                if self.run_trace(growth_factor, candidate) is not None:
+                    trace, removed = candidate, True  # Keep the smaller failing trace
+                else:
+                    start += chunk
+            if not removed:
+                chunk //= 2
+        return trace
+
+    def test_random_traces(self):
+        """Test that random traces of mixed operations match list"""
+        for seed in range(self._TRACES):
+            growth_factor, trace = self.random_trace(seed)
+            if self.run_trace(growth_factor, trace) is not None:
+                trace = self.shrink_trace(growth_factor, trace)
+                self.fail(f'Seed {seed} with growth factor {growth_factor} diverged from '
+                          f'list at {self.run_trace(growth_factor, trace)}\n'
+                          f'Minimal trace: {trace}')
+
+    def assertSameElements(self, expected, arr):
+        """Assert that arr holds exactly the objects in expected in the same order"""
+        self.assertEqual(len(expected), len(arr))
+        for i, (expected_element, element) in enumerate(zip(expected, arr)):
+            self.assertIs(expected_element, element, f'index {i}: {expected} != {arr}')
+
+    def random_sort_inputs(self, rng, length):
+        """Return lists of elements to sort that compare by value only with __eq__ and
+        with only __lt__
+        """
+        return [[_Item(rng.randrange(self._VALUES), tag) for tag in range(length)],
+                [_LessThanOnly(rng.randrange(self._VALUES)) for _ in range(length)]]
+
+    def test_sort_stability(self):
+        """Test that sorting keeps equal elements in their original order like list"""
+        rng = random.Random(0)
+        for length in [0, 1, 2, 10, 100, 1000]:
+            for items in self.random_sort_inputs(rng, length):
+                arr = DynamicArray()
+                arr.extend(items)
+                arr.sort()
+                self.assertSameElements(sorted(items), arr)
+
+    def test_parallel_fast_paths(self):
+        """Test that parallel sort, map, and reduce match their list equivalents, with
+        sort keeping the original objects rather than copies sent back by workers
+        """
+        rng = random.Random(0)
+        for length in [1, 2, 7, 50, 200]:
+            for items in self.random_sort_inputs(rng, length):
+                arr = DynamicArray()
+                arr.extend(items)
+                arr._PARALLEL_THRESHOLD = 1  # Lower threshold so the small arrays use workers
+
+                values = arr.map(_value, parallel=True, workers=3)
+                values._PARALLEL_THRESHOLD = 1
+                self.assertEqual([item.value for item in items], values)
+                self.assertEqual(max(item.value for item in items),
+                                 values.reduce(max, parallel=True, workers=3))
+                for workers in [2, 3, 4]:
+                    arr.sort(parallel=True, workers=workers)
+                    self.assertSameElements(sorted(items), arr)
+
+
+def _value(item):
+    """Return the value of an element in a way that can be pickled to worker processes"""
+    return item.value
+
+
+class ComplexityTestCase(unittest.TestCase):
+    """Scaling tests which time operations across array sizes and fit the exponent of
+    how the time per operation grows with the size, for example 0 for amortized O(1)
+    append and 1 for O(n) insertion at the front. These are timing based, so they only
+    run when the DYNAMIC_ARRAY_SCALING environment variable is set.
+    """
+    _SIZES = [2 ** i for i in range(10, 16)]  # Array sizes to time operations at
+    _REPEATS = 5  # The fastest of this many timings is used at each size
+    _TOLERANCE = 0.35  # Allowed difference between the fitted and expected exponents
+
+    def setUp(self):
+        """Skip unless scaling tests were requested"""
+        if not os.environ.get('DYNAMIC_ARRAY_SCALING'):
+            self.skipTest('set DYNAMIC_ARRAY_SCALING=1 to run scaling tests')
+
+    @staticmethod
+    def fit_exponent(sizes, times):
+        """Return the slope of the least squares line through log(size) and log(time)"""
+        xs = [math.log(size) for size in sizes]
+        ys = [math.log(time) for time in times]
+        x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+        covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+        return covariance / sum((x - x_mean) ** 2 for x in xs)
+
+    def assertComplexity(self, exponent, setup, operation, per_element=True):
+        """Assert that the time of operation(arr, n) on arr = setup(n), divided by n if
+        operation runs n times, grows like n ** exponent
+        """
+        times = []
+        for size in self._SIZES:
+            best = math.inf
+            for _ in range(self._REPEATS):
+                arr = setup(size)
+                gc.disable()  # Garbage collection pauses would be timed like timeit avoids
+                start_time = perf_counter()
+                operation(arr, size)
+                best = min(best, perf_counter() - start_time)
+                gc.enable()
+            times.append(best / size if per_element else best)
+
+        fitted = self.fit_exponent(self._SIZES, times)
+        self.assertAlmostEqual(exponent, fitted, delta=self._TOLERANCE,
+                               msg=f'times {times} fit n ** {fitted:.2f}')
+
+    @staticmethod
+    def filled(size):
+        """Return a DynamicArray holding range(size)"""
+        arr = DynamicArray()
+        arr.extend(range(size))
+        return arr
+
+    def test_append_amortized_constant(self):
+        """Test that appending n elements takes amortized O(1) time per append"""
+        def append_all(arr, size):
+            for i in range(size):
+                arr.append(i)
+        self.assertComplexity(0, lambda size: DynamicArray(), append_all)
+
+    def test_pop_amortized_constant(self):
+        """Test that popping n elements from the end takes amortized O(1) time per pop"""
+        def pop_all(arr, size):
+            for _ in range(size):
+                arr.pop()
+        self.assertComplexity(0, self.filled, pop_all)
+
+    def test_copy_constant(self):
+        """Test that copy-on-write copies take O(1) time"""
+        def copy_many(arr, size):  # Many copies so one slow first allocation is averaged out
+            for _ in range(1000):
+                arr.copy()
+        self.assertComplexity(0, self.filled, copy_many, per_element=False)
+
+    def test_insert_front_linear(self):
+        """Test that inserting at the front takes O(n) time"""
+        self.assertComplexity(1, self.filled, lambda arr, size: arr.insert(0, -1),
+                              per_element=False)
+
+    def test_sort_linearithmic(self):
+        """Test that sorting takes O(n log n) time, which fits close to n ** 1"""
+        def shuffled(size):
+            arr = self.filled(size)
+            random.Random(size).shuffle(arr)
+            return arr
+        self.assertComplexity(1, shuffled, lambda arr, size: arr.sort(), per_element=False)
+
+
+# Run tests when executed directly
+if __name__ == '__main__':
+    unittest.main()
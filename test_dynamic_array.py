@@ -1,3 +1,5 @@
+import copy
+import operator
 import unittest
 from time import time
 from dynamic_array import DynamicArray
@@ -142,6 +144,78 @@ class DynamicArrayTestCase(unittest.TestCase):
         self.arr.sort()
         self.assertEqual(sorted_list, self.arr)
 
+    def test_sort_stable(self):
+        """Test that sorting keeps elements that compare equal in their original order"""
+        # Tuples are sorted by their first value only, so the second shows the order
+        pairs = [(i % 3, i) for i in range(30, 0, -1)]
+        arr = DynamicArray(self._GROWTH_FACTOR)
+        for pair in pairs:
+            arr.append(_FirstValue(pair))
+        arr.sort()
+        self.assertEqual(sorted(pairs, key=lambda pair: pair[0]), [item.pair for item in arr])
+
+        # Sorting in parallel must merge chunks just as stably
+        arr = DynamicArray(self._GROWTH_FACTOR)
+        for pair in pairs:
+            arr.append(_FirstValue(pair))
+        arr._PARALLEL_THRESHOLD = 10  # Lower threshold so the small array uses workers
+        arr.sort(parallel=True, workers=4)
+        self.assertEqual(sorted(pairs, key=lambda pair: pair[0]), [item.pair for item in arr])
+
+    def test_sort_presorted(self):
+        """Test that sorting large already sorted and reversed arrays does not recurse"""
+        arr = DynamicArray(self._GROWTH_FACTOR)
+        arr.extend(range(10000, 0, -1))
+        arr.sort()
+        self.assertEqual([i for i in range(1, 10001)], arr)
+        arr.sort()
+        self.assertEqual([i for i in range(1, 10001)], arr)
+
+    def test_sort_parallel(self):
+        """Test that a parallel sort matches the serial sort when chunks are merged"""
+        values = [(i * 7919) % 101 for i in range(100)]  # Unordered values with repeats
+        arr = DynamicArray(self._GROWTH_FACTOR)
+        arr.extend(values)
+        arr._PARALLEL_THRESHOLD = 10  # Lower threshold so the small array uses workers
+        arr.sort(parallel=True, workers=3)
+        self.assertEqual(sorted(values), arr)
+
+        # The array must hold its own elements afterwards, not copies sent back by workers
+        elements = [[value] for value in values]
+        arr = DynamicArray(self._GROWTH_FACTOR)
+        arr.extend(elements)
+        arr._PARALLEL_THRESHOLD = 10
+        arr.sort(parallel=True, workers=3)
+        for expected, element in zip(sorted(elements), arr):
+            self.assertIs(expected, element)
+
+    def test_map(self):
+        """Test that map returns a new array with the function applied serially and in parallel"""
+        expected = [abs(i) for i in range(-50, 50)]
+        arr = DynamicArray(self._GROWTH_FACTOR)
+        arr.extend(range(-50, 50))
+        self.assertEqual(expected, arr.map(abs))
+
+        arr._PARALLEL_THRESHOLD = 10
+        self.assertEqual(expected, arr.map(abs, parallel=True, workers=3))
+        self.assertEqual([i for i in range(-50, 50)], arr)  # Original is unchanged
+
+    def test_reduce(self):
+        """Test that reduce combines elements serially and in parallel"""
+        arr = DynamicArray(self._GROWTH_FACTOR)
+        arr.extend(range(100))
+        self.assertEqual(sum(range(100)), arr.reduce(operator.add))
+        self.assertEqual(sum(range(100)) + 5, arr.reduce(operator.add, 5))
+
+        arr._PARALLEL_THRESHOLD = 10
+        self.assertEqual(sum(range(100)), arr.reduce(operator.add, parallel=True, workers=3))
+        self.assertEqual(99, arr.reduce(max, parallel=True, workers=3))
+
+    def test_reduce_empty(self):
+        """Test that reduce of an empty array needs an initial value"""
+        self.assertRaises(TypeError, DynamicArray().reduce, operator.add)
+        self.assertEqual(0, DynamicArray().reduce(operator.add, 0))
+
     def test_reverse(self):
         """Test that elements are reversed in array"""
         reversed_list = list(reversed([i for i in range(self._INITIAL_SIZE)]))
@@ -155,11 +229,66 @@ class DynamicArrayTestCase(unittest.TestCase):
             # Check for alias equality since this should be a shallow copy
             self.assertIs(copied_list[i], self.arr[i])
 
+    def test_copy_on_write(self):
+        """Test that a copy shares values until either array is modified"""
+        copied_arr = self.arr.copy()
+        # Protected data is checked since sharing the underlying array is the point
+        self.assertIs(self.arr._arr, copied_arr._arr)
+
+        copied_arr[0] = 'apple'  # First write copies the underlying array
+        self.assertIsNot(self.arr._arr, copied_arr._arr)
+        self.assertEqual(0, self.arr[0])
+        self.assertEqual(['apple'] + [i for i in range(1, self._INITIAL_SIZE)], copied_arr)
+
+        self.arr.append(self._INITIAL_SIZE)  # Original no longer needs to copy
+        self.assertEqual([i for i in range(self._INITIAL_SIZE + 1)], self.arr)
+
+    def test_copy_on_write_original_modified(self):
+        """Test that copies keep their values when the original array is modified"""
+        values = [i for i in range(self._INITIAL_SIZE)]
+        copies = [self.arr.copy(), self.arr.snapshot()]
+        self.arr.insert(0, 'apple')
+        self.arr.pop()
+        self.arr.reverse()
+        for copied_arr in copies:
+            self.assertEqual(values, copied_arr)
+        self.assertIs(copies[0]._arr, copies[1]._arr)  # Copies still share values
+
+    def test_copy_on_write_released(self):
+        """Test that a deleted copy no longer forces the original to copy on write"""
+        copied_arr = self.arr.copy()
+        del copied_arr
+        underlying_arr = self.arr._arr
+        self.arr[0] = 'apple'
+        self.assertIs(underlying_arr, self.arr._arr)
+
+    def test_copy_module(self):
+        """Test that copy.copy shares values safely and copy.deepcopy copies elements"""
+        self.arr.append([self._INITIAL_SIZE])
+        values = [i for i in range(self._INITIAL_SIZE)] + [[self._INITIAL_SIZE]]
+
+        shallow_arr = copy.copy(self.arr)
+        del shallow_arr  # Must not release the sharing counted for later copies
+        copied_arr = self.arr.copy()
+        copied_arr[0] = 'apple'
+        self.assertEqual(values, self.arr)
+
+        deep_arr = copy.deepcopy(self.arr)
+        self.assertEqual(values, deep_arr)
+        self.assertIsNot(self.arr[-1], deep_arr[-1])  # Elements are copied too
+        deep_arr[0] = 'apple'
+        self.assertEqual(values, self.arr)
+
     def test_print(self):
         """Test that array prints values similar to print(list)"""
         # Compare how python prints a list with the print of the array
         self.assertEqual(str([i for i in range(self._INITIAL_SIZE)]), str(self.arr),)
 
+    def test_print_uses_repr(self):
+        """Test that elements are printed with repr like print(list)"""
+        self.arr.append('apple')
+        self.assertEqual(str([i for i in range(self._INITIAL_SIZE)] + ['apple']), str(self.arr))
+
     def test_comparison_operators(self):
         """Test array support for comparison operators (==, !=, <, <=, >, >=)"""
         arr = DynamicArray(self._GROWTH_FACTOR)
@@ -176,6 +305,23 @@ class DynamicArrayTestCase(unittest.TestCase):
         self.assertGreaterEqual([i for i in range(1, 6)], arr)  # [1,2,3,4,5] >= [0,1,2,3,4]
         self.assertGreaterEqual([i for i in range(5)], arr)  # [0,1,2,3,4] >= [0,1,2,3,4]
 
+    def test_comparison_first_difference(self):
+        """Test that comparisons are decided by the first differing element like list"""
+        arr = DynamicArray(self._GROWTH_FACTOR)
+        arr.extend([1, 0])
+        for seq in [[0, 5], [1, 0], [1, 0, 0], [1], [2, -1], [1, 1]]:
+            self.assertEqual([1, 0] < seq, arr < seq, seq)
+            self.assertEqual([1, 0] <= seq, arr <= seq, seq)
+            self.assertEqual([1, 0] > seq, arr > seq, seq)
+            self.assertEqual([1, 0] >= seq, arr >= seq, seq)
+
+    def test_array_equality(self):
+        """Test that arrays compare equal to other arrays with the same values"""
+        self.assertEqual(self.arr, self.arr.copy())
+        self.assertEqual(self.arr, self.arr[:])
+        self.assertNotEqual(self.arr, self.arr[1:])
+        self.assertNotEqual(self.arr, tuple(range(self._INITIAL_SIZE)))  # Like list
+
     def test_item_assignment(self):
         """Test that array supports item assignment such as arr[1] = 2"""
         # Reassign values in array
@@ -186,6 +332,29 @@ class DynamicArrayTestCase(unittest.TestCase):
         self.assertEqual('apple', self.arr[0])
         self.assertEqual(-5, self.arr[3])
 
+    def test_negative_index_out_of_bounds(self):
+        """Test that negative indices before the start raise IndexError instead of
+        referring to the first element
+        """
+        idx = -self._INITIAL_SIZE - 1
+        self.assertEqual(0, self.arr[-self._INITIAL_SIZE])
+        self.assertRaises(IndexError, self.arr.__getitem__, idx)
+        self.assertRaises(IndexError, self.arr.__setitem__, idx, 'apple')
+        self.assertRaises(IndexError, self.arr.pop, idx)
+        self.assertRaises(IndexError, self.arr.__delitem__, idx)
+        self.assertEqual([i for i in range(self._INITIAL_SIZE)], self.arr)  # Unchanged
+
+    def test_index_negative_start(self):
+        """Test that a negative start for index counts from the end like list"""
+        self.arr.append(0)
+        self.assertEqual(self._INITIAL_SIZE, self.arr.index(0, -1))
+        self.assertEqual(0, self.arr.index(0, -100))
+
+    def test_extend_self(self):
+        """Test that extending an array with itself doubles it once"""
+        self.arr.extend(self.arr)
+        self.assertEqual([i for i in range(self._INITIAL_SIZE)] * 2, self.arr)
+
     def test_array_in_operator(self):
         """Test functionality of the in operator for the array"""
         # Add values to end of array
@@ -236,6 +405,50 @@ class DynamicArrayTestCase(unittest.TestCase):
         self.assertEqual(py_list[::-1], self.arr[::-1])  # Slice with negative step
         self.assertEqual(py_list[::-3], self.arr[::-3])  # Slice with negative step >1
 
+    def test_array_slicing_out_of_bounds(self):
+        """Test slicing with out of bounds values and negative steps matches list"""
+        py_list = [i for i in range(self._INITIAL_SIZE)]
+        for idx in [slice(-100, 100), slice(2, 100), slice(100, None), slice(3, 1, -1),
+                    slice(None, 1, -1), slice(-2, None, -2), slice(100, -100, -3)]:
+            self.assertEqual(py_list[idx], self.arr[idx], idx)
+        self.assertRaises(ValueError, self.arr.__getitem__, slice(None, None, 0))
+
+    def test_array_slice_deletion(self):
+        """Test that array deletes sliced items with syntax del arr[i:j:k]"""
+        for idx in [slice(1, 3), slice(None, None, 2), slice(None, None, -2),
+                    slice(-2, None), slice(100, None)]:
+            py_list = [i for i in range(self._INITIAL_SIZE)]
+            arr = DynamicArray(self._GROWTH_FACTOR)
+            arr.extend(py_list)
+            del py_list[idx]
+            del arr[idx]
+            self.assertEqual(py_list, arr, idx)
+
+    def test_array_slice_assignment(self):
+        """Test that array replaces sliced values with syntax arr[i:j:k] = seq like list"""
+        for idx, values in [(slice(1, 3), ['x']), (slice(1, 3), ['x', 'y', 'z']),
+                            (slice(None), []), (slice(3, 1), ['x']), (slice(100, None), ['x']),
+                            (slice(None, None, 2), ['x', 'y', 'z']),
+                            (slice(None, None, -1), 'abcde')]:
+            py_list = [i for i in range(self._INITIAL_SIZE)]
+            arr = DynamicArray(self._GROWTH_FACTOR)
+            arr.extend(py_list)
+            py_list[idx] = values
+            arr[idx] = values
+            self.assertEqual(py_list, arr, idx)
+
+        # Extended slices need a sequence of the same length, and values must be iterable
+        self.assertRaises(ValueError, self.arr.__setitem__, slice(None, None, 2), ['x'])
+        self.assertRaises(TypeError, self.arr.__setitem__, slice(1, 2), 5)
+        self.assertEqual([i for i in range(self._INITIAL_SIZE)], self.arr)  # Unchanged
+
+        # Assigning the array to a slice of itself and to a copy-on-write copy
+        copied_arr = self.arr.copy()
+        self.arr[1:1] = self.arr
+        self.assertEqual([0] + [i for i in range(self._INITIAL_SIZE)] +
+                         [i for i in range(1, self._INITIAL_SIZE)], self.arr)
+        self.assertEqual([i for i in range(self._INITIAL_SIZE)], copied_arr)
+
     def test_array_default_bool(self):
         """Test if array's default boolean value is False if no items or True otherwise"""
         self.assertTrue(self.arr)  # Array should be True if there are elements in it
@@ -299,6 +512,15 @@ class DynamicArrayTestCase(unittest.TestCase):
         self.assertEqual(self._GROWTH_FACTOR, len(large_arr._arr))
 
 
+class _FirstValue:
+    """Wrapper for a pair which compares by only the first value for testing stability"""
+    def __init__(self, pair):
+        self.pair = pair
+
+    def __lt__(self, other):
+        return self.pair[0] < other.pair[0]
+
+
 # Run tests when executed directly
 if __name__ == '__main__':
     unittest.main()